@@ -1,22 +1,90 @@
+import functools
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urlparse, unquote
 
+# --- Parser backend: lxml's C parser when installed, the stdlib parser otherwise ---
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # --- Global set to track processed product folder names across different calls ---
 processed_product_folders = set()
 
+# --- Shared HTTP session so image downloads reuse pooled keep-alive connections ---
+http_session = requests.Session()
+http_session.headers.update({'User-Agent': 'Mozilla/5.0'})
+# Bytes pulled per iteration when streaming an image to disk; larger chunks mean fewer Python-level writes
+IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# --- Patterns compiled once at import instead of on every product ---
+INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+WHITESPACE_RE = re.compile(r'\s+')
+RESIZED_IMAGE_RE = re.compile(r'-\d+x\d+\.[a-zA-Z]{3,4}$')
+IMAGE_SIZE_SUFFIX_RE = re.compile(r'^(.*)(-\d+x\d+(@\dx)?)\.([a-zA-Z]{3,5})$') # Allow 5 for .jpeg
+
+# --- Product container matchers, defined once and handed straight to find_all ---
+def is_default_product_container(tag):
+    classes = tag.get('class', ())
+    return tag.name == 'div' and 'product' in classes and 'et-isotope-item' in classes
+
+def is_woodmart_product_container(tag):
+    return tag.name == 'div' and 'product-grid-item' in tag.get('class', ())
+
+# --- Tag lookups, built once as SoupStrainers instead of on every find() call ---
+ADD_TO_CART_BUTTON = SoupStrainer('a', class_='add_to_cart_button')
+QUICK_VIEW_SPAN = SoupStrainer('span', class_='show-quickly')
+PRICE_SPAN = SoupStrainer('span', class_='price')
+PRICE_AMOUNT_SPAN = SoupStrainer('span', class_='woocommerce-Price-amount')
+CURRENCY_SYMBOL_SPAN = SoupStrainer('span', class_='woocommerce-Price-currencySymbol')
+DEFAULT_TITLE_HEADING = SoupStrainer('h2', class_='product-title')
+DEFAULT_CATEGORY_DIV = SoupStrainer('div', class_='products-page-cats')
+DEFAULT_IMAGE_LINK = SoupStrainer('a', class_='product-content-image')
+WOODMART_TITLE_HEADING = SoupStrainer('h3', class_='wd-entities-title')
+WOODMART_CATEGORY_DIV = SoupStrainer('div', class_='wd-product-cats')
+WOODMART_IMAGE_LINK = SoupStrainer('a', class_='product-image-link')
+DEFAULT_PRODUCT_FALLBACK_DIV = SoupStrainer('div', class_='product')
+LINK_TAG = SoupStrainer('a')
+IMAGE_TAG = SoupStrainer('img')
+BDI_TAG = SoupStrainer('bdi')
+
+# --- parse_only filters: only product blocks and their subtrees are built into the soup ---
+# While parsing, bs4 hands these the raw class attribute string, so the predicate splits it itself.
+def has_class_token(token):
+    return lambda class_value: bool(class_value) and token in class_value.split()
+
+PRODUCT_BLOCK_FILTERS = {
+    "default": SoupStrainer('div', class_=has_class_token('product')),
+    "woodmart": SoupStrainer('div', class_=has_class_token('product-grid-item')),
+}
+
+# --- Layout of each product's info_product.txt, filled from the product_data dict ---
+INFO_FILE_TEMPLATE = (
+    "### Product name\n{name}\n\n"
+    "### Product ID\n{id}\n\n"
+    "### Link\n{link}\n\n"
+    "### Price\n{price}\n\n"
+    "### Category\n{category}\n\n"
+    "### Image Link\n{image_link_for_txt}\n"
+)
+
 def sanitize_filename(name):
-    name = re.sub(r'[<>:"/\\|?*]', '', name)
-    name = re.sub(r'\s+', '_', name)
+    name = INVALID_FILENAME_CHARS_RE.sub('', name)
+    name = WHITESPACE_RE.sub('_', name)
     return name[:100]
 
+@functools.lru_cache(maxsize=4096)
 def get_original_image_url(image_url, srcset_str=None):
     """
     Attempts to get the best quality image URL.
     1. Tries to parse srcset for the largest image or one without dimensions.
     2. If no srcset or parsing fails, tries to remove WordPress-like dimension suffixes.
+    Results are memoized per (image_url, srcset_str), so the same image seen
+    again (another listing page, a re-run) skips the srcset parse.
     """
     if not image_url and not srcset_str:
         return None
@@ -40,7 +108,7 @@ def get_original_image_url(image_url, srcset_str=None):
             if candidates:
                 # Prefer URLs without typical WP resizing patterns in filename, then largest width
                 non_resized_candidates = [
-                    c for c in candidates if not re.search(r'-\d+x\d+\.[a-zA-Z]{3,4}$', c['url'])
+                    c for c in candidates if not RESIZED_IMAGE_RE.search(c['url'])
                 ]
                 if non_resized_candidates:
                     best_url = max(non_resized_candidates, key=lambda x: x['width'])['url']
@@ -59,7 +127,7 @@ def get_original_image_url(image_url, srcset_str=None):
         return None
 
     # Regex to find patterns like "-123x456" or "-123x456@2x" before the extension
-    match = re.match(r'^(.*)(-\d+x\d+(@\dx)?)\.([a-zA-Z]{3,5})$', best_url) # Allow 5 for .jpeg
+    match = IMAGE_SIZE_SUFFIX_RE.match(best_url)
     if match:
         base_name = match.group(1)
         extension = match.group(4)
@@ -85,10 +153,173 @@ def check_existing_folders(base_path):
         print(f"Base path '{base_path}' does not exist yet.")
 
 
-def extract_product_info(html_content, site_type="default"):
+def extract_price(price_span):
+    """
+    Returns the displayed price (currency symbol + amount) from a WooCommerce price span.
+    Shared by every site_type: reads the bare text nodes of the first amount's <bdi>,
+    falling back to the amount's or the span's full text when that structure is missing.
+    """
+    amount_bdi = price_span.find(PRICE_AMOUNT_SPAN)
+    bdi_tag = amount_bdi.find(BDI_TAG) if amount_bdi else None
+    if bdi_tag:
+        currency_symbol_tag = amount_bdi.find(CURRENCY_SYMBOL_SPAN)
+        currency_symbol = currency_symbol_tag.text.strip() if currency_symbol_tag else ""
+        price_value = "".join(node for node in bdi_tag.contents if isinstance(node, str)).strip()
+        return f"{currency_symbol}{price_value}"
+    if amount_bdi:
+        return amount_bdi.text.strip()
+    return price_span.text.strip()
+
+
+def find_default_containers(soup):
+    """
+    Returns the product blocks of a 4strader.shop like page, falling back to any div with the product class.
+    """
+    product_containers = soup.find_all(is_default_product_container)
+    if not product_containers:
+        product_containers = soup.find_all(DEFAULT_PRODUCT_FALLBACK_DIV) # Fallback for default
+    return product_containers
+
+
+def extract_default_fields(product_div, index, product_data):
+    """
+    Fills product_data from a 4strader.shop like product block and returns the raw image src (or None).
+    """
+    raw_image_src = None
+    # ID extraction
+    add_to_cart_btn = product_div.find(ADD_TO_CART_BUTTON)
+    if add_to_cart_btn and add_to_cart_btn.get('data-product_id'):
+        product_data["id"] = add_to_cart_btn.get('data-product_id')
+    else:
+        quick_view_span = product_div.find(QUICK_VIEW_SPAN)
+        if quick_view_span and quick_view_span.get('data-prodid'):
+            product_data["id"] = quick_view_span.get('data-prodid')
+        else:
+            post_class = [cls for cls in product_div.get('class', []) if cls.startswith('post-')]
+            if post_class: product_data["id"] = post_class[0].split('-')[-1]
+
+    if product_data["id"] == "N/A": product_data["id"] = f"TEMP_DEFAULT_{index+1}"
+
+    title_tag = product_div.find(DEFAULT_TITLE_HEADING)
+    title_link = title_tag.find(LINK_TAG) if title_tag else None
+    if title_link:
+        product_data["name"] = title_link.text.strip()
+        product_data["link"] = title_link.get('href', 'N/A')
+
+    price_span = product_div.find(PRICE_SPAN)
+    if price_span:
+        product_data["price"] = extract_price(price_span)
+
+    category_div_ = product_div.find(DEFAULT_CATEGORY_DIV)
+    category_link = category_div_.find(LINK_TAG) if category_div_ else None
+    if category_link:
+        product_data["category"] = category_link.text.strip()
+
+    img_container = product_div.find(DEFAULT_IMAGE_LINK)
+    img_tag = img_container.find(IMAGE_TAG) if img_container else None
+    if img_tag:
+        raw_image_src = img_tag.get('data-src') or img_tag.get('data-lazy-src') or img_tag.get('src')
+        srcset = img_tag.get('srcset')
+        product_data["image_url"] = get_original_image_url(raw_image_src, srcset)
+    return raw_image_src
+
+
+def find_woodmart_containers(soup):
+    """
+    Returns the product grid items of a khannawazllc.com like page.
+    """
+    return soup.find_all(is_woodmart_product_container)
+
+
+def extract_woodmart_fields(product_div, index, product_data):
+    """
+    Fills product_data from a khannawazllc.com like product grid item and returns the raw image src (or None).
+    """
+    raw_image_src = None
+    product_data["id"] = product_div.get('data-id', f"TEMP_WOODMART_{index+1}")
+
+    title_tag = product_div.find(WOODMART_TITLE_HEADING)
+    title_link = title_tag.find(LINK_TAG) if title_tag else None
+    if title_link:
+        product_data["name"] = title_link.text.strip()
+        product_data["link"] = title_link.get('href', 'N/A')
+
+    price_span = product_div.find(PRICE_SPAN) # Often WooCommerce standard
+    if price_span:
+        product_data["price"] = extract_price(price_span)
+
+    category_div_ = product_div.find(WOODMART_CATEGORY_DIV)
+    category_link = category_div_.find(LINK_TAG) if category_div_ else None
+    if category_link:
+        product_data["category"] = category_link.text.strip()
+
+    img_link_tag = product_div.find(WOODMART_IMAGE_LINK)
+    img_tag = img_link_tag.find(IMAGE_TAG) if img_link_tag else None
+    if img_tag:
+        raw_image_src = img_tag.get('data-src') or img_tag.get('data-lazy-src') or img_tag.get('src')
+        srcset = img_tag.get('srcset')
+        product_data["image_url"] = get_original_image_url(raw_image_src, srcset)
+    return raw_image_src
+
+
+# site_type -> (container finder, per-product field extractor); picked once per page, not per product
+SITE_EXTRACTORS = {
+    "default": (find_default_containers, extract_default_fields),
+    "woodmart": (find_woodmart_containers, extract_woodmart_fields),
+}
+
+
+def iter_product_records(html_content, site_type="default", encoding=None):
+    """
+    Yields a product_data dict for each product block in html_content, in page order, as soon as it is parsed.
+    Callers that only need the first few products (or stream them out) can stop early without building the rest.
+    html_content may be str or raw bytes; for bytes whose charset is known, pass encoding so bs4 skips sniffing it.
+    site_type must be a key of SITE_EXTRACTORS.
+    """
+    find_containers, extract_fields = SITE_EXTRACTORS[site_type]
+
+    # Page chrome (header, menus, scripts, footer) is skipped while parsing instead of built and discarded
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=PRODUCT_BLOCK_FILTERS[site_type], from_encoding=encoding)
+
+    for index, product_div in enumerate(find_containers(soup)):
+        product_data = {
+            "name": "N/A", "id": "N/A", "link": "N/A", "price": "N/A",
+            "category": "N/A", "image_url": None, "image_link_for_txt": "N/A"
+        }
+        raw_image_src = extract_fields(product_div, index, product_data) # original src before cleaning, for fallback
+
+        # --- Common Processing Logic ---
+        # Collapse whitespace with split/join (same whitespace set as \s) and drop a doubled currency token
+        parts = product_data["price"].split()
+        if len(parts) > 1 and parts[0] == parts[1] and not parts[1][0].isdigit():
+            del parts[1]
+        product_data["price"] = " ".join(parts)
+
+        product_data["image_link_for_txt"] = product_data["image_url"] if product_data["image_url"] else "N/A"
+        product_data["raw_image_src"] = raw_image_src
+
+        yield product_data
+
+
+@functools.lru_cache(maxsize=32)
+def parse_product_records(html_content, site_type="default", encoding=None):
+    """
+    Collects iter_product_records() into a tuple.
+    It touches neither the filesystem nor the folder tracking set, so results are memoized per
+    (html_content, site_type): a page seen again in the same process skips the HTML parse entirely.
+    Returns None for an unknown site_type. The returned dicts are shared between callers and must not be modified.
+    """
+    if site_type not in SITE_EXTRACTORS:
+        return None
+    return tuple(iter_product_records(html_content, site_type, encoding))
+
+
+def extract_product_info(html_content, site_type="default", encoding=None):
     """
     Extracts product information from HTML content and organizes it into folders.
+    Parsing is delegated to parse_product_records(); this function deduplicates, writes the info files and downloads images.
     site_type can be "default" (for 4strader.shop like structure) or "woodmart" (for khannawazllc.com like structure).
+    encoding optionally declares the charset of bytes input (e.g. "utf-8").
     """
     global processed_product_folders
     
@@ -98,7 +329,6 @@ def extract_product_info(html_content, site_type="default"):
 
     processed_product_ids = set() # Track IDs for this run/call
 
-    soup = BeautifulSoup(html_content, 'html.parser')
     base_products_folder = "products"
     os.makedirs(base_products_folder, exist_ok=True)
     
@@ -108,132 +338,30 @@ def extract_product_info(html_content, site_type="default"):
     print(f"Using site_type: '{site_type}'. Base folder: '{base_products_folder}'.")
     print(f"Currently tracking {len(processed_product_folders)} product folders to avoid duplicates.")
 
-    product_containers = []
-    if site_type == "default":
-        product_containers = soup.find_all('div', class_=lambda x: x and 'product' in x.split() and 'et-isotope-item' in x.split())
-        if not product_containers:
-            product_containers = soup.find_all('div', class_='product') # Fallback for default
-    elif site_type == "woodmart":
-        product_containers = soup.find_all('div', class_='product-grid-item')
-    else:
+    product_records = parse_product_records(html_content, site_type, encoding)
+    if product_records is None:
         print(f"Error: Unknown site_type '{site_type}'.")
         return
 
-    if not product_containers:
+    if not product_records:
         print("No product containers found for the specified site_type. Please check your HTML structure and selectors.")
         return
 
-    print(f"Found {len(product_containers)} potential product block(s).")
+    print(f"Found {len(product_records)} potential product block(s).")
 
     products_added = 0
     products_skipped_duplicate_folder = 0
     products_skipped_duplicate_id = 0
     products_skipped_missing_info = 0
 
-    for index, product_div in enumerate(product_containers):
-        product_data = {
-            "name": "N/A", "id": "N/A", "link": "N/A", "price": "N/A",
-            "category": "N/A", "image_url": None, "image_link_for_txt": "N/A"
-        }
-        raw_image_src = None # To store the original src before cleaning, for fallback
-
-        # --- Site-Specific Selectors ---
-        if site_type == "default":
-            # ID extraction
-            add_to_cart_btn = product_div.find('a', class_='add_to_cart_button')
-            if add_to_cart_btn and add_to_cart_btn.get('data-product_id'):
-                product_data["id"] = add_to_cart_btn.get('data-product_id')
-            else:
-                quick_view_span = product_div.find('span', class_='show-quickly')
-                if quick_view_span and quick_view_span.get('data-prodid'):
-                    product_data["id"] = quick_view_span.get('data-prodid')
-                else:
-                    post_class = [cls for cls in product_div.get('class', []) if cls.startswith('post-')]
-                    if post_class: product_data["id"] = post_class[0].split('-')[-1]
-
-            if product_data["id"] == "N/A": product_data["id"] = f"TEMP_DEFAULT_{index+1}"
-
-            # Check for duplicate product IDs
-            if product_data["id"] in processed_product_ids:
-                print(f"  Skipping duplicate product ID ({site_type}): {product_data['id']}")
-                products_skipped_duplicate_id += 1
-                continue
-            processed_product_ids.add(product_data["id"])
-
-            title_tag = product_div.find('h2', class_='product-title')
-            if title_tag and title_tag.find('a'):
-                product_data["name"] = title_tag.find('a').text.strip()
-                product_data["link"] = title_tag.find('a').get('href', 'N/A')
-
-            price_span = product_div.find('span', class_='price')
-            if price_span:
-                amount_bdi = price_span.find('span', class_='woocommerce-Price-amount')
-                if amount_bdi and amount_bdi.find('bdi'):
-                    currency_symbol_tag = amount_bdi.find('span', class_='woocommerce-Price-currencySymbol')
-                    currency_symbol = currency_symbol_tag.text.strip() if currency_symbol_tag else ""
-                    price_text_nodes = [node for node in amount_bdi.find('bdi').contents if isinstance(node, str)]
-                    price_value = "".join(price_text_nodes).strip()
-                    product_data["price"] = f"{currency_symbol}{price_value}"
-                elif amount_bdi: product_data["price"] = amount_bdi.text.strip()
-                else: product_data["price"] = price_span.text.strip()
-
-            category_div_ = product_div.find('div', class_='products-page-cats')
-            if category_div_ and category_div_.find('a'):
-                product_data["category"] = category_div_.find('a').text.strip()
-
-            img_container = product_div.find('a', class_='product-content-image')
-            if img_container and img_container.find('img'):
-                img_tag = img_container.find('img')
-                raw_image_src = img_tag.get('data-src') or img_tag.get('data-lazy-src') or img_tag.get('src')
-                srcset = img_tag.get('srcset')
-                product_data["image_url"] = get_original_image_url(raw_image_src, srcset)
-
-
-        elif site_type == "woodmart":
-            product_data["id"] = product_div.get('data-id', f"TEMP_WOODMART_{index+1}")
-
-            # Check for duplicate product IDs
-            if product_data["id"] in processed_product_ids:
-                print(f"  Skipping duplicate product ID ({site_type}): {product_data['id']}")
-                products_skipped_duplicate_id += 1
-                continue
-            processed_product_ids.add(product_data["id"])
-
-            title_tag = product_div.find('h3', class_='wd-entities-title')
-            if title_tag and title_tag.find('a'):
-                product_data["name"] = title_tag.find('a').text.strip()
-                product_data["link"] = title_tag.find('a').get('href', 'N/A')
-
-            price_span = product_div.find('span', class_='price') # Often WooCommerce standard
-            if price_span: # Same price logic can often be reused
-                amount_bdi = price_span.find('span', class_='woocommerce-Price-amount')
-                if amount_bdi and amount_bdi.find('bdi'):
-                    currency_symbol_tag = amount_bdi.find('span', class_ ='woocommerce-Price-currencySymbol')
-                    currency_symbol = currency_symbol_tag.text.strip() if currency_symbol_tag else ""
-                    price_text_nodes = [node for node in amount_bdi.find('bdi').contents if isinstance(node, str)]
-                    price_value = "".join(price_text_nodes).strip()
-                    product_data["price"] = f"{currency_symbol}{price_value}"
-                elif amount_bdi: product_data["price"] = amount_bdi.text.strip()
-                else: product_data["price"] = price_span.text.strip()
-
-            category_div_ = product_div.find('div', class_='wd-product-cats')
-            if category_div_ and category_div_.find('a'):
-                product_data["category"] = category_div_.find('a').text.strip()
-
-            img_link_tag = product_div.find('a', class_='product-image-link')
-            if img_link_tag and img_link_tag.find('img'):
-                img_tag = img_link_tag.find('img')
-                raw_image_src = img_tag.get('data-src') or img_tag.get('data-lazy-src') or img_tag.get('src')
-                srcset = img_tag.get('srcset')
-                product_data["image_url"] = get_original_image_url(raw_image_src, srcset)
-
-        # --- Common Processing Logic ---
-        product_data["price"] = re.sub(r'\s+', ' ', product_data["price"]).strip()
-        parts = product_data["price"].split()
-        if len(parts) > 1 and parts[0] == parts[1] and not parts[1][0].isdigit():
-            product_data["price"] = " ".join([parts[0]] + parts[2:])
-        
-        product_data["image_link_for_txt"] = product_data["image_url"] if product_data["image_url"] else "N/A"
+    for index, product_data in enumerate(product_records):
+        # Check for duplicate product IDs
+        if product_data["id"] in processed_product_ids:
+            print(f"  Skipping duplicate product ID ({site_type}): {product_data['id']}")
+            products_skipped_duplicate_id += 1
+            continue
+        processed_product_ids.add(product_data["id"])
+        raw_image_src = product_data["raw_image_src"]
 
         # Skip if missing critical info
         if product_data["name"] == "N/A" and product_data["id"].startswith("TEMP_"):
@@ -260,12 +388,7 @@ def extract_product_info(html_content, site_type="default"):
 
         info_file_path = os.path.join(current_product_path, "info_product.txt")
         with open(info_file_path, 'w', encoding='utf-8') as f:
-            f.write(f"### Product name\n{product_data['name']}\n\n")
-            f.write(f"### Product ID\n{product_data['id']}\n\n")
-            f.write(f"### Link\n{product_data['link']}\n\n")
-            f.write(f"### Price\n{product_data['price']}\n\n")
-            f.write(f"### Category\n{product_data['category']}\n\n")
-            f.write(f"### Image Link\n{product_data['image_link_for_txt']}\n")
+            f.write(INFO_FILE_TEMPLATE.format_map(product_data))
         print(f"    Created info file: '{info_file_path}'")
 
         if product_data["image_url"]:
@@ -273,7 +396,7 @@ def extract_product_info(html_content, site_type="default"):
             os.makedirs(main_images_folder, exist_ok=True)
             try:
                 print(f"    Attempting to download image: {product_data['image_url']}")
-                img_response = requests.get(product_data["image_url"], stream=True, timeout=20, headers={'User-Agent': 'Mozilla/5.0'})
+                img_response = http_session.get(product_data["image_url"], stream=True, timeout=20)
                 img_response.raise_for_status()
 
                 parsed_url = urlparse(product_data["image_url"])
@@ -291,14 +414,14 @@ def extract_product_info(html_content, site_type="default"):
                 
                 image_save_path = os.path.join(main_images_folder, sanitize_filename(image_filename))
                 with open(image_save_path, 'wb') as img_file:
-                    for chunk in img_response.iter_content(chunk_size=8192): img_file.write(chunk)
+                    for chunk in img_response.iter_content(chunk_size=IMAGE_DOWNLOAD_CHUNK_SIZE): img_file.write(chunk)
                 print(f"    Downloaded image: '{image_save_path}'")
             except requests.exceptions.RequestException as e:
                 print(f"    Error downloading image {product_data['image_url']}: {e}")
                 if raw_image_src and raw_image_src != product_data["image_url"]: # Try original src if cleaned one failed
                     print(f"    Attempting fallback download for raw src: {raw_image_src}")
                     try:
-                        img_response = requests.get(raw_image_src, stream=True, timeout=20, headers={'User-Agent': 'Mozilla/5.0'})
+                        img_response = http_session.get(raw_image_src, stream=True, timeout=20)
                         img_response.raise_for_status()
                         parsed_url = urlparse(raw_image_src)
                         image_filename = os.path.basename(unquote(parsed_url.path))
@@ -306,7 +429,7 @@ def extract_product_info(html_content, site_type="default"):
                         if not os.path.splitext(image_filename)[1]: image_filename += ".jpg"
                         image_save_path = os.path.join(main_images_folder, sanitize_filename(image_filename))
                         with open(image_save_path, 'wb') as img_file:
-                            for chunk in img_response.iter_content(chunk_size=8192): img_file.write(chunk)
+                            for chunk in img_response.iter_content(chunk_size=IMAGE_DOWNLOAD_CHUNK_SIZE): img_file.write(chunk)
                         print(f"    Downloaded fallback image: '{image_save_path}'")
                     except requests.exceptions.RequestException as e2:
                         print(f"    Fallback download failed for {raw_image_src}: {e2}")
@@ -338,9857 +461,31 @@ def reset_folder_tracking():
     print("Folder tracking has been reset.")
 
 
-# --- HTML code for the site structure (khannawazllc.com like - WoodMart theme) ---
-html_code_woodmart = """
-
-      <div
-                class="products elements-grid wd-products-holder wd-spacing-20 grid-columns-3 pagination-pagination align-items-start row"
-                data-source="main_loop"
-                data-min_price=""
-                data-max_price=""
-                data-columns="3"
-              >
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17793 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="1"
-                  data-id="17793"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/30-counts-disposable-potty-liners-compatible-with-oxo/"
-                        class="product-image-link"
-                      >
-                        <img
-                          loading="lazy"
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/potty1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/potty1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/potty1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/potty1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/potty1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/potty1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/potty1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/potty1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/potty1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/30-counts-disposable-potty-liners-compatible-with-oxo/"
-                        >
-                          <img
-                            loading="lazy"
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/potty3-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/potty3-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/potty3-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/potty3-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/potty3-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/potty3-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/potty3-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/potty3-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/potty3.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17793"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/30-counts-disposable-potty-liners-compatible-with-oxo/"
-                          >[30 Counts] Disposable Potty Liners Compatible with OXO</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >12.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Universal Fit: Works great with most popular portable potties, including
-                            large models like OXO Tot 2-in-1 Go Potty. Absorbent &amp;
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17793"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17793"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17793"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;[30 Counts] Disposable Potty Liners Compatible with OXO&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;[30 Counts] Disposable Potty Liners Compatible with OXO&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/30-counts-disposable-potty-liners-compatible-with-oxo/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17793"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17755 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="2"
-                  data-id="17755"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/alex-artist-studio-magnetic-letters-kids-art-and-craft-activity/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/alex1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/alex1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/alex1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/alex1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/alex1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/alex1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/alex1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/alex1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/alex1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/alex-artist-studio-magnetic-letters-kids-art-and-craft-activity/"
-                        >
-                          <img
-                            width="340"
-                            height="500"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/alex2.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/alex2.jpg         340w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/alex2-204x300.jpg 204w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/alex2-150x221.jpg 150w
-                            "
-                            sizes="(max-width: 340px) 100vw, 340px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17755"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/alex-artist-studio-magnetic-letters-kids-art-and-craft-activity/"
-                          >Alex Artist Studio Magnetic Letters Kids Art and Craft Activity</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >9.22</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Leave messages on the refrigerator Learn the alphabet and how to spell
-                            some words Bright colors including yellow, red, blue,
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17755"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17755"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17755"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Alex Artist Studio Magnetic Letters Kids Art and Craft Activity&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Alex Artist Studio Magnetic Letters Kids Art and Craft Activity&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/alex-artist-studio-magnetic-letters-kids-art-and-craft-activity/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17755"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17351 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="3"
-                  data-id="17351"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/amplim-baby-food-maker-for-nutritious-homemade-meals/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="422"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1-430x422.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1-430x422.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1-306x300.jpg  306w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1-815x800.jpg  815w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1-768x754.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1-860x844.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1-700x687.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1-150x147.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Amplim1.jpg         1493w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/amplim-baby-food-maker-for-nutritious-homemade-meals/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Amplim2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Amplim2-430x430.jpg 430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Amplim2-300x300.jpg 300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Amplim2-150x150.jpg 150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Amplim2-700x700.jpg 700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Amplim2.jpg         752w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17351"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/amplim-baby-food-maker-for-nutritious-homemade-meals/"
-                          >Amplim Baby Food Maker for Nutritious Homemade Meals</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >129.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Healthy &amp; Delicious: Easy to use touch screen is programmable for
-                            various cook times, preserving nutrients, vitamins and the natural
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17351"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17351"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17351"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Amplim Baby Food Maker for Nutritious Homemade Meals&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Amplim Baby Food Maker for Nutritious Homemade Meals&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/amplim-baby-food-maker-for-nutritious-homemade-meals/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17351"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17765 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="4"
-                  data-id="17765"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/aquaphor-baby-healing-ointment-advanced-therapy-skin-protectant/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/aqua1-1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/aquaphor-baby-healing-ointment-advanced-therapy-skin-protectant/"
-                        >
-                          <img
-                            width="430"
-                            height="394"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1-430x394.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1-430x394.jpg 430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1-327x300.jpg 327w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1-872x800.jpg 872w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1-768x704.jpg 768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1-860x789.jpg 860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1-700x642.jpg 700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1-150x138.jpg 150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/aqua2-1.jpg         951w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17765"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/aquaphor-baby-healing-ointment-advanced-therapy-skin-protectant/"
-                          >Aquaphor Baby Healing Ointment Advanced Therapy Skin Protectant</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >19.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            One Essential Solution: Aquaphor Baby Healing Ointment is clinically
-                            proven to restore smooth, healthy skin, a perfect multi-purpose solution
-                            for
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17765"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17765"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17765"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Aquaphor Baby Healing Ointment Advanced Therapy Skin Protectant&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Aquaphor Baby Healing Ointment Advanced Therapy Skin Protectant&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/aquaphor-baby-healing-ointment-advanced-therapy-skin-protectant/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17765"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17391 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="5"
-                  data-id="17391"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/aussie-kids-shampoo-conditioner-and-leave-in-conditioner/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Aussie1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/aussie-kids-shampoo-conditioner-and-leave-in-conditioner/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Aussie2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17391"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/aussie-kids-shampoo-conditioner-and-leave-in-conditioner/"
-                          >Aussie Kids Shampoo, Conditioner, and Leave-in Conditioner</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >14.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            MAKE IT ROUTINE: Its never too early to start your childs hair care
-                            routine, especially when it comes to keeping
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17391"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17391"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17391"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Aussie Kids Shampoo, Conditioner, and Leave-in Conditioner&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Aussie Kids Shampoo, Conditioner, and Leave-in Conditioner&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/aussie-kids-shampoo-conditioner-and-leave-in-conditioner/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17391"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17375 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="6"
-                  data-id="17375"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/berrcom-baby-nasal-aspirator/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a href="https://khannawazllc.com/product/berrcom-baby-nasal-aspirator/">
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Berrcom2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17375"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a href="https://khannawazllc.com/product/berrcom-baby-nasal-aspirator/"
-                          >Berrcom Baby Nasal Aspirator</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >26.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            ★Electric Baby Nasal Aspirator:Our baby nose suction has ergonomic
-                            dolphin body design,comfortable and easy to grip.Safely and effectively
-                            clear your
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17375"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17375"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17375"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Berrcom Baby Nasal Aspirator&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Berrcom Baby Nasal Aspirator&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/berrcom-baby-nasal-aspirator/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17375"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17834 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="7"
-                  data-id="17834"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/cetaphil-baby-wash-shampoo-with-organic-calendula/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/ceta1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ceta1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ceta1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ceta1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ceta1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ceta1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ceta1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ceta1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ceta1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/cetaphil-baby-wash-shampoo-with-organic-calendula/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/ceta2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ceta2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ceta2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ceta2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ceta2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ceta2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ceta2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ceta2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ceta2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17834"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/cetaphil-baby-wash-shampoo-with-organic-calendula/"
-                          >Cetaphil Baby Wash &#038; Shampoo with Organic Calendula</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >9.97</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            CETAPHIL BABY WASH &amp; SHAMPOO: This tear free 2-in-1 formula blends
-                            into a rich lather to gently cleanse your baby‚Äôs
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17834"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17834"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17834"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Cetaphil Baby Wash &amp; Shampoo with Organic Calendula&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Cetaphil Baby Wash &amp; Shampoo with Organic Calendula&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/cetaphil-baby-wash-shampoo-with-organic-calendula/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17834"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17853 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="8"
-                  data-id="17853"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/desitin-maximum-strength-baby-diaper-rash-cream/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/desi1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/desi1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/desi1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/desi1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/desi1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/desi1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/desi1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/desi1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/desi1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/desitin-maximum-strength-baby-diaper-rash-cream/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/desi2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/desi2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/desi2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/desi2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/desi2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/desi2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/desi2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/desi2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/desi2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17853"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/desitin-maximum-strength-baby-diaper-rash-cream/"
-                          >Desitin Maximum Strength Baby Diaper Rash Cream</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >25.72</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            16-ounce jar of Desitin Maximum Strength Diaper Rash Paste with 40% zinc
-                            oxide works on contact to treat and prevent
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17853"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17853"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17853"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Desitin Maximum Strength Baby Diaper Rash Cream&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Desitin Maximum Strength Baby Diaper Rash Cream&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/desitin-maximum-strength-baby-diaper-rash-cream/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17853"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17764 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="9"
-                  data-id="17764"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/dial-kids-3-in-1-bodyhairbubble-bath-lavender-scent/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/dial1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/dial1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/dial1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/dial1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/dial1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/dial1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/dial1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/dial1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/dial1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/dial-kids-3-in-1-bodyhairbubble-bath-lavender-scent/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/dial2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/dial2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/dial2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/dial2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/dial2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/dial2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/dial2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/dial2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/dial2.jpg         1000w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17764"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/dial-kids-3-in-1-bodyhairbubble-bath-lavender-scent/"
-                          >Dial Kids 3-in-1 Body+Hair+Bubble Bath, Lavender Scent</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >7.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            MULTIBENEFIT: Specially designed 3-in-1 formula for body, hair + bubble
-                            bath, made just for kids! GENTLE &amp; MOISTURIZING FORMULA: Tear
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17764"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17764"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17764"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Dial Kids 3-in-1 Body+Hair+Bubble Bath, Lavender Scent&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Dial Kids 3-in-1 Body+Hair+Bubble Bath, Lavender Scent&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/dial-kids-3-in-1-bodyhairbubble-bath-lavender-scent/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17764"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17783 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="10"
-                  data-id="17783"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/diapers-size-1-120-count-pampers-baby-dry-disposable-diapers/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/pamp1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pamp1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pamp1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pamp1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pamp1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pamp1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pamp1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pamp1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pamp1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/diapers-size-1-120-count-pampers-baby-dry-disposable-diapers/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/pamp2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pamp2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pamp2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pamp2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pamp2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pamp2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pamp2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pamp2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pamp2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17783"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/diapers-size-1-120-count-pampers-baby-dry-disposable-diapers/"
-                          >Diapers Size 1, 120 count &#8211; Pampers Baby Dry Disposable Diapers</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >28.22</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Up to 100% leakproof nights and happy mornings with LockAway Channels
-                            Helps prevent leaks with stretchy sides and large tape
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17783"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17783"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17783"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Diapers Size 1, 120 count - Pampers Baby Dry Disposable Diapers&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Diapers Size 1, 120 count - Pampers Baby Dry Disposable Diapers&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/diapers-size-1-120-count-pampers-baby-dry-disposable-diapers/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17783"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17843 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="11"
-                  data-id="17843"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/dr-browns-infant-to-toddler-toothbrushes-with-baby-toothpaste/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/too1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/too1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/too1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/too1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/too1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/too1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/too1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/too1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/too1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/dr-browns-infant-to-toddler-toothbrushes-with-baby-toothpaste/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/too2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/too2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/too2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/too2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/too2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/too2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/too2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/too2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/too2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17843"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/dr-browns-infant-to-toddler-toothbrushes-with-baby-toothpaste/"
-                          >Dr. Brown&#8217;s Infant to Toddler Toothbrushes with Baby Toothpaste</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >13.97</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Contains (2) Dr. Brown’s Infant-to-Toddler Training Toothbrushes (1)
-                            Giraffe (1) Blue Elephant and (1) Dr. Brown&#8217;s Baby Toothpaste,
-                            Strawberry Flavor,
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17843"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17843"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17843"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Dr. Brown&#039;s Infant to Toddler Toothbrushes with Baby Toothpaste&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Dr. Brown&#039;s Infant to Toddler Toothbrushes with Baby Toothpaste&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/dr-browns-infant-to-toddler-toothbrushes-with-baby-toothpaste/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17843"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17784 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="12"
-                  data-id="17784"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/dr-browns-natural-flow-level-2-baby-silicone-nipple/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/br1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/br1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/br1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/br1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/br1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/br1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/br1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/br1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/br1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/dr-browns-natural-flow-level-2-baby-silicone-nipple/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/br2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/br2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/br2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/br2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/br2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/br2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/br2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/br2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/br2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17784"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/dr-browns-natural-flow-level-2-baby-silicone-nipple/"
-                          >Dr. Brown’s Natural Flow Level 2 Baby Silicone Nipple</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >11.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            NIPPLE FOR GROWING BABY. Dr. Brown’s Medium Flow Nipple is the next step
-                            for growing babies. ANTI-COLIC BABY BOTTLE WITH
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17784"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17784"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17784"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Dr. Brown’s Natural Flow Level 2  Baby Silicone Nipple&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Dr. Brown’s Natural Flow Level 2  Baby Silicone Nipple&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/dr-browns-natural-flow-level-2-baby-silicone-nipple/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17784"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17358 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="13"
-                  data-id="17358"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/electric-nasal-aspirator-for-baby/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/electric-nasal-aspirator-for-baby/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Electric-Nasal2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17358"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/electric-nasal-aspirator-for-baby/"
-                          >Electric Nasal Aspirator for Baby</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >29.69</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            【Clean Your Baby&#8217;s Nose Easily and Effectively】Say goodbye to a
-                            stuffy nose with HEVAVW electric baby nasal aspirator! This nasal
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17358"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17358"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17358"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Electric Nasal Aspirator for Baby&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Electric Nasal Aspirator for Baby&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/electric-nasal-aspirator-for-baby/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17358"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17383 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="14"
-                  data-id="17383"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/foreverpure-baby-gift-set/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a href="https://khannawazllc.com/product/foreverpure-baby-gift-set/">
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/FOREVERPURE2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17383"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a href="https://khannawazllc.com/product/foreverpure-baby-gift-set/"
-                          >FOREVERPURE Baby Gift Set</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >39.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Newborn Baby Gift Set: A thoughtful gift set for little ones curated
-                            with love and care for every newborn baby.
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17383"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17383"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17383"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;FOREVERPURE Baby Gift Set&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;FOREVERPURE Baby Gift Set&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/foreverpure-baby-gift-set/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17383"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17398 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="15"
-                  data-id="17398"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/frida-baby-3-in-1-sound-machine-when-to-wake-clock/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="447"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Frida1-430x447.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Frida1-430x447.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Frida1-289x300.jpg  289w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Frida1-770x800.jpg  770w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Frida1-768x798.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Frida1-860x893.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Frida1-700x727.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Frida1-150x156.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Frida1.jpg         1444w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/frida-baby-3-in-1-sound-machine-when-to-wake-clock/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Frida2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Frida2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Frida2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Frida2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Frida2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Frida2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Frida2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Frida2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Frida2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17398"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/frida-baby-3-in-1-sound-machine-when-to-wake-clock/"
-                          >Frida Baby 3-in-1 Sound Machine + When-to-Wake Clock</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >49.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            SOUND MACHINE: Nursery essential with timer/auto shut-off (15, 30, 60
-                            mins) and 7 sleepy sounds &#8211; white noise, pink noise,
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17398"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17398"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17398"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Frida Baby 3-in-1 Sound Machine + When-to-Wake Clock&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Frida Baby 3-in-1 Sound Machine + When-to-Wake Clock&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/frida-baby-3-in-1-sound-machine-when-to-wake-clock/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17398"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17390 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="16"
-                  data-id="17390"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/hkai-baby-sound-machine/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/HKAI1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a href="https://khannawazllc.com/product/hkai-baby-sound-machine/">
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/HKAI2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17390"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a href="https://khannawazllc.com/product/hkai-baby-sound-machine/"
-                          >HKAI Baby Sound Machine</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >22.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Soothing Sounds: 20 soothing sounds (5 white noises, 5 fan sounds, 2
-                            rain sounds and 8 natural and other sounds)
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17390"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17390"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17390"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;HKAI Baby Sound Machine&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;HKAI Baby Sound Machine&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/hkai-baby-sound-machine/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17390"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17774 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="17"
-                  data-id="17774"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/huggies-natural-care-sensitive-baby-wipes/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/hug1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/hug1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/hug1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/hug1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/hug1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/hug1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/hug1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/hug1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/hug1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/huggies-natural-care-sensitive-baby-wipes/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/hug2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/hug2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/hug2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/hug2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/hug2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/hug2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/hug2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/hug2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/hug2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17774"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/huggies-natural-care-sensitive-baby-wipes/"
-                          >Huggies Natural Care Sensitive Baby Wipes</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >34.01</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            12 flip-top packs of 64 Huggies Natural Care Sensitive Baby Wipes,
-                            Unscented (768 wipes total), the same baby wipes you
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17774"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17774"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17774"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Huggies Natural Care Sensitive Baby Wipes&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Huggies Natural Care Sensitive Baby Wipes&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/huggies-natural-care-sensitive-baby-wipes/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17774"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17359 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="18"
-                  data-id="17359"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/immunity-gummies-5-in-1-by-maryruths-raspberry-lemonade/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="414"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1-430x414.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1-430x414.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1-311x300.jpg  311w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1-830x800.jpg  830w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1-768x740.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1-860x828.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1-700x674.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1-150x145.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Immunity1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/immunity-gummies-5-in-1-by-maryruths-raspberry-lemonade/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Immunity2.jpg         1000w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17359"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/immunity-gummies-5-in-1-by-maryruths-raspberry-lemonade/"
-                          >Immunity Gummies 5-in-1 by MaryRuth&#8217;s (Raspberry Lemonade)</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >34.95</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Immunity Gummies: MaryRuth’s Immunity Gummies are formulated with
-                            ingredients to give you the immune support you need! This powerful blend
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17359"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17359"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17359"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Immunity Gummies 5-in-1 by MaryRuth&#039;s (Raspberry Lemonade)&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Immunity Gummies 5-in-1 by MaryRuth&#039;s (Raspberry Lemonade)&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/immunity-gummies-5-in-1-by-maryruths-raspberry-lemonade/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17359"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17833 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="19"
-                  data-id="17833"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/johnsons-head-to-toe-gentle-baby-body-wash-shampoo/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/jo1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/jo1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/jo1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/jo1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/jo1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/jo1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/jo1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/jo1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/jo1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/johnsons-head-to-toe-gentle-baby-body-wash-shampoo/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/jo2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/jo2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/jo2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/jo2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/jo2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/jo2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/jo2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/jo2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/jo2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17833"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/johnsons-head-to-toe-gentle-baby-body-wash-shampoo/"
-                          >Johnson&#8217;s Head-To-Toe Gentle Baby Body Wash &#038; Shampoo</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >10.32</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Use Johnson&#8217;s Head-To-Toe Baby Body Wash and Hair Shampoo to
-                            gently care for your baby&#8217;s sensitive skin. Bath time is
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17833"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17833"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17833"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Johnson&#039;s Head-To-Toe Gentle Baby Body Wash &amp; Shampoo&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Johnson&#039;s Head-To-Toe Gentle Baby Body Wash &amp; Shampoo&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/johnsons-head-to-toe-gentle-baby-body-wash-shampoo/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17833"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17366 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="20"
-                  data-id="17366"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/kindermat-1-5-thick-pbs-kids-kinderbundle/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/kindermat-1-5-thick-pbs-kids-kinderbundle/"
-                        >
-                          <img
-                            width="430"
-                            height="436"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2-430x436.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2-430x436.jpg 430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2-296x300.jpg 296w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2-789x800.jpg 789w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2-768x778.jpg 768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2-860x872.jpg 860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2-700x710.jpg 700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2-150x152.jpg 150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/KinderMat2.jpg         956w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17366"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/kindermat-1-5-thick-pbs-kids-kinderbundle/"
-                          >KinderMat 1.5&#8243; Thick + PBS Kids Kinderbundle</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >45.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            PBS KIDS &#8211; We have teamed up with PBS KIDS to offer a Kindermat
-                            BUNDLE with a new full cover
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17366"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17366"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17366"
-                              data-product_sku=""
-                              aria-label='Add to cart: &ldquo;KinderMat 1.5" Thick + PBS Kids Kinderbundle&rdquo;'
-                              rel="nofollow"
-                              data-success_message='&ldquo;KinderMat 1.5" Thick + PBS Kids Kinderbundle&rdquo; has been added to your cart'
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/kindermat-1-5-thick-pbs-kids-kinderbundle/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17366"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17424 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="21"
-                  data-id="17424"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/little-bum-coolers-car-seat-cooler-for-children/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Little1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Little1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Little1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Little1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Little1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Little1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Little1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Little1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Little1.jpg         1080w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/little-bum-coolers-car-seat-cooler-for-children/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Little2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Little2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Little2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Little2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Little2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Little2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Little2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Little2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Little2.jpg         1080w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17424"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/little-bum-coolers-car-seat-cooler-for-children/"
-                          >Little Bum Coolers &#8211; Car Seat Cooler for Children</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >39.50</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            100% Polyester, EPE Foam with aluminum foil, 100% cotton CAR SEAT
-                            COOLER: Infant and toddler car seats can reach sweltering
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17424"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17424"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17424"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Little Bum Coolers - Car Seat Cooler for Children&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Little Bum Coolers - Car Seat Cooler for Children&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/little-bum-coolers-car-seat-cooler-for-children/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17424"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17367 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="22"
-                  data-id="17367"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/littletora-pro-baby-nasal-aspirator/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/littletora-pro-baby-nasal-aspirator/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/LittleTora2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17367"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/littletora-pro-baby-nasal-aspirator/"
-                          >LittleTora Pro Baby Nasal Aspirator</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >59.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Hospital Grade Suction for Instant Relief: Compared to the standard
-                            handheld baby nasal aspirator, this baby and toddler nasal aspirator
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17367"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17367"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17367"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;LittleTora Pro Baby Nasal Aspirator&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;LittleTora Pro Baby Nasal Aspirator&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/littletora-pro-baby-nasal-aspirator/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17367"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17804 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="23"
-                  data-id="17804"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/my-travel-tray-made-in-usa-a-cup-holder-travel-tray/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/travl1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/travl1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/travl1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/travl1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/travl1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/travl1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/travl1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/travl1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/travl1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/my-travel-tray-made-in-usa-a-cup-holder-travel-tray/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/travl2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/travl2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/travl2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/travl2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/travl2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/travl2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/travl2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/travl2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/travl2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17804"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/my-travel-tray-made-in-usa-a-cup-holder-travel-tray/"
-                          >My Travel Tray &#8211; Made in USA &#8211; A Cup Holder Travel Tray</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >22.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            LESS MESS MEANS LESS STRESS: Reduce crumbs and spillages in your car! My
-                            Travel Tray keeps snacks and drinks out
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17804"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17804"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17804"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;My Travel Tray - Made in USA - A Cup Holder Travel Tray&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;My Travel Tray - Made in USA - A Cup Holder Travel Tray&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/my-travel-tray-made-in-usa-a-cup-holder-travel-tray/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17804"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17374 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="24"
-                  data-id="17374"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/oogiebear-nose-and-ear-gadget/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a href="https://khannawazllc.com/product/oogiebear-nose-and-ear-gadget/">
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/oogiebear2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17374"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a href="https://khannawazllc.com/product/oogiebear-nose-and-ear-gadget/"
-                          >oogiebear &#8211; Nose and Ear Gadget</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >12.95</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            BEAR-ABLE SAFETY AND COMFORT &#8211; oogiebear&#8217;s special rubber
-                            scoop and loop are gentle enough for sensitive little noses and ears
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17374"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17374"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17374"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;oogiebear - Nose and Ear Gadget&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;oogiebear - Nose and Ear Gadget&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/oogiebear-nose-and-ear-gadget/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17374"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17431 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="25"
-                  data-id="17431"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/pripher-mommy-bag-for-hospital/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="432"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1-430x432.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1-430x432.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1-298x300.jpg  298w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1-796x800.jpg  796w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1-150x151.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1-768x772.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1-860x865.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1-700x704.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Pripher1.jpg         1492w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a href="https://khannawazllc.com/product/pripher-mommy-bag-for-hospital/">
-                          <img
-                            width="430"
-                            height="542"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2-430x542.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2-430x542.jpg   430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2-238x300.jpg   238w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2-635x800.jpg   635w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2-768x968.jpg   768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2-860x1084.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2-700x882.jpg   700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2-150x189.jpg   150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Pripher2.jpg          1157w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17431"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a href="https://khannawazllc.com/product/pripher-mommy-bag-for-hospital/"
-                          >Pripher Mommy Bag for Hospital</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >39.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Diaper Bag Backpack &#8211; Pripher large capacity mommy bag with 14
-                            pockets designes for multi-child families, including 3 insulated bottle
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17431"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17431"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17431"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Pripher Mommy Bag for Hospital&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Pripher Mommy Bag for Hospital&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/pripher-mommy-bag-for-hospital/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17431"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17794 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="26"
-                  data-id="17794"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/pull-ups-boys-nighttime-potty-training-pants-underwear/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/pull1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pull1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pull1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pull1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pull1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pull1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pull1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pull1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/pull1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/pull-ups-boys-nighttime-potty-training-pants-underwear/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/pull3-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pull3-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pull3-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pull3-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pull3-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pull3-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pull3-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pull3-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/pull3.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17794"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/pull-ups-boys-nighttime-potty-training-pants-underwear/"
-                          >Pull-Ups Boys&#8217; Nighttime Potty Training Pants &#038; Underwear</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >24.22</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Pull-Ups Boys’ Night-Time Potty Training Pants: 60 overnight potty
-                            training underwear for boys, size 3T-4T (60 training pants total)
-                            Absorbs
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17794"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17794"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17794"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Pull-Ups Boys&#039; Nighttime Potty Training Pants &amp; Underwear&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Pull-Ups Boys&#039; Nighttime Potty Training Pants &amp; Underwear&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/pull-ups-boys-nighttime-potty-training-pants-underwear/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17794"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17408 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="27"
-                  data-id="17408"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/retrospec-cricket-baby-walker-balance-bike-with-4-wheels-for-ages-12-24-months/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/retrospec-cricket-baby-walker-balance-bike-with-4-wheels-for-ages-12-24-months/"
-                        >
-                          <img
-                            width="430"
-                            height="754"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec2-430x754.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec2-430x754.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec2-171x300.jpg  171w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec2-456x800.jpg  456w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec2-768x1347.jpg 768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec2-700x1228.jpg 700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec2-150x263.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Retrospec2.jpg          855w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17408"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/retrospec-cricket-baby-walker-balance-bike-with-4-wheels-for-ages-12-24-months/"
-                          >Retrospec Cricket Baby Walker Balance Bike with 4 Wheels for Ages 12-24
-                          Months</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >49.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            BEGINNER BABY BIKE: Retrospec Cricket is designed for toddlers ages
-                            12-24 months of age to develop the motor skills needed
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17408"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17408"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17408"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Retrospec Cricket Baby Walker Balance Bike with 4 Wheels for Ages 12-24 Months&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Retrospec Cricket Baby Walker Balance Bike with 4 Wheels for Ages 12-24 Months&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/retrospec-cricket-baby-walker-balance-bike-with-4-wheels-for-ages-12-24-months/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17408"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17823 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="28"
-                  data-id="17823"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/safety-1st-parent-grip-door-knob-covers-white/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/safe1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/safe1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/safe1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/safe1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/safe1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/safe1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/safe1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/safe1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/safe1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/safety-1st-parent-grip-door-knob-covers-white/"
-                        >
-                          <img
-                            width="430"
-                            height="287"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/afe2-430x287.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/afe2-430x287.jpg   430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/afe2-400x267.jpg   400w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/afe2-1200x800.jpg 1200w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/afe2-768x512.jpg   768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/afe2-860x573.jpg   860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/afe2-700x467.jpg   700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/afe2-150x100.jpg   150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/afe2.jpg          1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17823"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/safety-1st-parent-grip-door-knob-covers-white/"
-                          >Safety 1st Parent Grip Door Knob Covers, White</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >3.98</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Easy for parents to install and use Knob cover spins freely so tiny
-                            hands can&#8217;t twist the door knob open
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17823"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17823"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17823"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Safety 1st Parent Grip Door Knob Covers, White&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Safety 1st Parent Grip Door Knob Covers, White&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/safety-1st-parent-grip-door-knob-covers-white/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17823"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17415 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="29"
-                  data-id="17415"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/schwinn-deluxe-bicycle-mounted-child-carrier-bike-seat-for-children/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/schwinn-deluxe-bicycle-mounted-child-carrier-bike-seat-for-children/"
-                        >
-                          <img
-                            width="430"
-                            height="400"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2-430x400.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2-430x400.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2-322x300.jpg  322w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2-859x800.jpg  859w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2-768x715.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2-860x801.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2-700x652.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2-150x140.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Schwinn2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17415"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/schwinn-deluxe-bicycle-mounted-child-carrier-bike-seat-for-children/"
-                          >Schwinn Deluxe Bicycle Mounted Child Carrier/Bike Seat for Children</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >129.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Rack is compatible with seat post diameters from 25 to 32mm, frame
-                            mounted rear bike seat is easily assembled, making
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17415"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17415"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17415"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Schwinn Deluxe Bicycle Mounted Child Carrier/Bike Seat for Children&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Schwinn Deluxe Bicycle Mounted Child Carrier/Bike Seat for Children&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/schwinn-deluxe-bicycle-mounted-child-carrier-bike-seat-for-children/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17415"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
+# --- Sample listing pages, kept as files so importing this module doesn't load them ---
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "fixtures")
 
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17813 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="30"
-                  data-id="17813"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/skip-hop-baby-bath-spout-cover-universal-fit/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/skip1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/skip1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/skip1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/skip1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/skip1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/skip1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/skip1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/skip1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/skip1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/skip-hop-baby-bath-spout-cover-universal-fit/"
-                        >
-                          <img
-                            width="430"
-                            height="537"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/skip3-430x537.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/skip3-430x537.jpg   430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/skip3-240x300.jpg   240w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/skip3-641x800.jpg   641w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/skip3-768x959.jpg   768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/skip3-860x1074.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/skip3-700x874.jpg   700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/skip3-150x187.jpg   150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/skip3.jpg          1201w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17813"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/skip-hop-baby-bath-spout-cover-universal-fit/"
-                          >Skip Hop Baby Bath Spout Cover, Universal Fit</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >14.00</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Make bath time bump-free and fun for baby with the Moby faucet cover,
-                            our best-selling whale The sleek spout cover
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17813"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17813"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17813"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Skip Hop Baby Bath Spout Cover, Universal Fit&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Skip Hop Baby Bath Spout Cover, Universal Fit&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/skip-hop-baby-bath-spout-cover-universal-fit/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17813"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17824 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="31"
-                  data-id="17824"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/slumberpod-portable-sleep-pod-baby-blackout-canopy/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/slum1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/slum1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/slum1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/slum1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/slum1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/slum1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/slum1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/slum1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/slum1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/slumberpod-portable-sleep-pod-baby-blackout-canopy/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/slum2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/slum2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/slum2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/slum2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/slum2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/slum2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/slum2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/slum2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/slum2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17824"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/slumberpod-portable-sleep-pod-baby-blackout-canopy/"
-                          >SlumberPod Portable Sleep Pod Baby Blackout Canopy</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >179.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            AS SEEN ON SHARK TANK &#8211; BABY/TODDLER BLACKOUT SLEEP POD:
-                            SlumberPod is a blackout privacy pod sleep nook that allows
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17824"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17824"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17824"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;SlumberPod Portable Sleep Pod Baby Blackout Canopy&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;SlumberPod Portable Sleep Pod Baby Blackout Canopy&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/slumberpod-portable-sleep-pod-baby-blackout-canopy/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17824"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17416 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="32"
-                  data-id="17416"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/spiffies-baby-oral-care-tooth-wipes/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/spiffies-baby-oral-care-tooth-wipes/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Spiffies2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17416"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/spiffies-baby-oral-care-tooth-wipes/"
-                          >Spiffies Baby Oral Care Tooth Wipes</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >23.85</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Swallowable, fluoride free, xylitol rich and tastes great Clincially
-                            shown to reduce cavities Babies and their parents prefer spiffies to
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17416"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17416"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17416"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Spiffies Baby Oral Care Tooth Wipes&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Spiffies Baby Oral Care Tooth Wipes&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/spiffies-baby-oral-care-tooth-wipes/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17416"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17814 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="33"
-                  data-id="17814"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/stove-knob-covers-for-child-safety-5-1-pack/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/st1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/st1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/st1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/st1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/st1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/st1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/st1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/st1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/st1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/stove-knob-covers-for-child-safety-5-1-pack/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/st2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/st2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/st2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/st2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/st2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/st2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/st2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/st2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/st2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17814"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/stove-knob-covers-for-child-safety-5-1-pack/"
-                          >Stove Knob Covers for Child Safety (5 + 1 Pack)</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >25.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            1. [Easy to Use for Adults] The new unlocking method with a improved
-                            safety factor makes it hard for babies
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17814"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17814"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17814"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Stove Knob Covers for Child Safety (5 + 1 Pack)&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Stove Knob Covers for Child Safety (5 + 1 Pack)&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/stove-knob-covers-for-child-safety-5-1-pack/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17814"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item wd-with-labels product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17382 status-publish instock product_cat-kids-baby has-post-thumbnail sale shipping-taxable purchasable product-type-simple"
-                  data-loop="34"
-                  data-id="17382"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/thermometer-for-adults-and-kids-forehead-thermometer/"
-                        class="product-image-link"
-                      >
-                        <link
-                          rel="stylesheet"
-                          id="wd-woo-mod-product-labels-css"
-                          href="https://khannawazllc.com/wp-content/themes/woodmart/css/parts/woo-mod-product-labels.min.css?ver=7.3.4"
-                          type="text/css"
-                          media="all"
-                        />
-                        <link
-                          rel="stylesheet"
-                          id="wd-woo-mod-product-labels-rect-css"
-                          href="https://khannawazllc.com/wp-content/themes/woodmart/css/parts/woo-mod-product-labels-rect.min.css?ver=7.3.4"
-                          type="text/css"
-                          media="all"
-                        />
-                        <div class="product-labels labels-rectangular">
-                          <span class="onsale product-label">-20%</span>
-                        </div>
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/thermometer-for-adults-and-kids-forehead-thermometer/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Thermometer-2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17382"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/thermometer-for-adults-and-kids-forehead-thermometer/"
-                          >Thermometer for Adults and Kids Forehead Thermometer</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><del aria-hidden="true"
-                              ><span class="woocommerce-Price-amount amount"
-                                ><bdi
-                                  ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                  >20.00</bdi
-                                ></span
-                              ></del
-                            >
-                            <span class="screen-reader-text">Original price was: &#036;20.00.</span
-                            ><ins aria-hidden="true"
-                              ><span class="woocommerce-Price-amount amount"
-                                ><bdi
-                                  ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                  >15.99</bdi
-                                ></span
-                              ></ins
-                            ><span class="screen-reader-text"
-                              >Current price is: &#036;15.99.</span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            ➤【Touchless Measuring】Non-contact infrared thermometer reads from
-                            forehead with no physical contact, prevents cross-infection between
-                            multiple peoples. Safer and healthier, especially
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17382"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17382"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17382"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Thermometer for Adults and Kids Forehead Thermometer&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Thermometer for Adults and Kids Forehead Thermometer&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/thermometer-for-adults-and-kids-forehead-thermometer/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17382"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17803 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="35"
-                  data-id="17803"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/toilet-potty-training-seat-with-step-stool-ladder/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/to1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/to1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/to1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/to1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/to1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/to1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/to1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/to1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/to1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/toilet-potty-training-seat-with-step-stool-ladder/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/to2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/to2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/to2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/to2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/to2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/to2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/to2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/to2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/to2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17803"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/toilet-potty-training-seat-with-step-stool-ladder/"
-                          >Toilet Potty Training Seat with Step Stool Ladder</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >35.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            FITS MOST TOLIET SHAPES AND SIZE: SKYROKU kids potty training seat fits
-                            all standard size and elongated toilet seats(like V/U/O
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17803"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17803"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17803"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Toilet Potty Training Seat with Step Stool Ladder&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Toilet Potty Training Seat with Step Stool Ladder&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/toilet-potty-training-seat-with-step-stool-ladder/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17803"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17844 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="36"
-                  data-id="17844"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/vtech-vm819-video-baby-monitor-with-19-hour-battery-life/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/v1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/v1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/v1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/v1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/v1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/v1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/v1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/v1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/v1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/vtech-vm819-video-baby-monitor-with-19-hour-battery-life/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/v3-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/v3-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/v3-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/v3-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/v3-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/v3-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/v3-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/v3-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/v3.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17844"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/vtech-vm819-video-baby-monitor-with-19-hour-battery-life/"
-                          >VTech VM819 Video Baby Monitor with 19 Hour Battery Life</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >64.95</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            Best-in-class Battery Life and Range &#8211; With up to 19 hours of
-                            video streaming on a single charge, this system
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17844"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17844"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17844"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;VTech VM819 Video Baby Monitor with 19 Hour Battery Life&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;VTech VM819 Video Baby Monitor with 19 Hour Battery Life&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/vtech-vm819-video-baby-monitor-with-19-hour-battery-life/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17844"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17775 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="37"
-                  data-id="17775"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/waterwipes-plastic-free-original-99-9-water-based-wipes/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/w1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/w1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/w1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/w1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/w1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/w1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/w1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/w1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/w1.jpg         1000w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/waterwipes-plastic-free-original-99-9-water-based-wipes/"
-                        >
-                          <img
-                            width="430"
-                            height="457"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/w2-430x457.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/w2-430x457.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/w2-282x300.jpg  282w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/w2-752x800.jpg  752w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/w2-768x817.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/w2-860x915.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/w2-700x745.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/w2-150x160.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/w2.jpg         1410w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17775"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/waterwipes-plastic-free-original-99-9-water-based-wipes/"
-                          >WaterWipes Plastic-Free Original 99.9% Water Based Wipes</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >12.93</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            PACKAGING MAY VARY: Every package of WaterWipes Original Wipes still
-                            contains the same pure and trusted water-based wipes PURE, SIMPLE
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17775"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17775"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17775"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;WaterWipes Plastic-Free Original 99.9% Water Based Wipes&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;WaterWipes Plastic-Free Original 99.9% Water Based Wipes&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/waterwipes-plastic-free-original-99-9-water-based-wipes/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17775"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 type-product post-17399 status-publish instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="38"
-                  data-id="17399"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/wingyz-kids-drum-set-for-toddlers-baby-music-instruments/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/wingyz-kids-drum-set-for-toddlers-baby-music-instruments/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/Wingyz2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17399"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/wingyz-kids-drum-set-for-toddlers-baby-music-instruments/"
-                          >Wingyz Kids Drum Set for Toddlers Baby Music Instruments</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >31.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            ???? Natural Wood &amp; Smooth Surfaces: Our baby musical instrument is
-                            made of eco-friendly &amp; natural wood material with environmental
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17399"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17399"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17399"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;Wingyz Kids Drum Set for Toddlers Baby Music Instruments&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;Wingyz Kids Drum Set for Toddlers Baby Music Instruments&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/wingyz-kids-drum-set-for-toddlers-baby-music-instruments/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17399"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 last type-product post-17407 status-publish last instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="39"
-                  data-id="17407"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/zebrater-baby-high-chair-8-in-1-high-chairs-for-babies-and-toddlers/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/zebrater-baby-high-chair-8-in-1-high-chairs-for-babies-and-toddlers/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZEBRATER2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17407"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/zebrater-baby-high-chair-8-in-1-high-chairs-for-babies-and-toddlers/"
-                          >ZEBRATER Baby High Chair 8 in 1 High Chairs for Babies and Toddlers</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >125.99</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            ????【8 in 1 Baby High Chair】This convertible highchair for babies and
-                            toddlers can be converted into multiple modes, including a
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17407"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17407"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17407"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;ZEBRATER Baby High Chair 8 in 1 High Chairs for Babies and Toddlers&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;ZEBRATER Baby High Chair 8 in 1 High Chairs for Babies and Toddlers&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/zebrater-baby-high-chair-8-in-1-high-chairs-for-babies-and-toddlers/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17407"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-
-                <div
-                  class="product-grid-item product product-no-swatches wd-hover-base wd-hover-with-fade col-lg-4 col-md-4 col-6 first type-product post-17423 status-publish first instock product_cat-kids-baby has-post-thumbnail shipping-taxable purchasable product-type-simple"
-                  data-loop="40"
-                  data-id="17423"
-                >
-                  <div class="product-wrapper">
-                    <div class="content-product-imagin"></div>
-                    <div class="product-element-top wd-quick-shop">
-                      <a
-                        href="https://khannawazllc.com/product/zorunowa-car-headrest-pillow-thickened-memory-foam-road-pal-headrest/"
-                        class="product-image-link"
-                      >
-                        <img
-                          width="430"
-                          height="430"
-                          src="https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1-430x430.jpg"
-                          class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                          alt=""
-                          decoding="async"
-                          srcset="
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1-430x430.jpg  430w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1-300x300.jpg  300w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1-800x800.jpg  800w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1-150x150.jpg  150w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1-768x768.jpg  768w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1-860x860.jpg  860w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1-700x700.jpg  700w,
-                            https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA1.jpg         1500w
-                          "
-                          sizes="(max-width: 430px) 100vw, 430px"
-                        />
-                      </a>
-
-                      <div class="hover-img">
-                        <a
-                          href="https://khannawazllc.com/product/zorunowa-car-headrest-pillow-thickened-memory-foam-road-pal-headrest/"
-                        >
-                          <img
-                            width="430"
-                            height="430"
-                            src="https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2-430x430.jpg"
-                            class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                            alt=""
-                            decoding="async"
-                            srcset="
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2-430x430.jpg  430w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2-300x300.jpg  300w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2-800x800.jpg  800w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2-150x150.jpg  150w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2-768x768.jpg  768w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2-860x860.jpg  860w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2-700x700.jpg  700w,
-                              https://khannawazllc.com/wp-content/uploads/2024/09/ZORUNOWA2.jpg         1500w
-                            "
-                            sizes="(max-width: 430px) 100vw, 430px"
-                          />
-                        </a>
-                      </div>
-
-                      <div class="wrapp-swatches">
-                        <div
-                          class="wd-compare-btn product-compare-button wd-action-btn wd-style-icon wd-compare-icon"
-                        >
-                          <a
-                            href="https://khannawazllc.com/compare/"
-                            data-id="17423"
-                            rel="nofollow"
-                            data-added-text="Compare products"
-                          >
-                            <span>Compare</span>
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    <div class="product-element-bottom product-information">
-                      <h3 class="wd-entities-title">
-                        <a
-                          href="https://khannawazllc.com/product/zorunowa-car-headrest-pillow-thickened-memory-foam-road-pal-headrest/"
-                          >ZORUNOWA Car Headrest Pillow Thickened Memory Foam Road Pal Headrest</a
-                        >
-                      </h3>
-                      <div class="wd-product-cats">
-                        <a href="https://khannawazllc.com/product-category/kids-baby/" rel="tag"
-                          >Kids &amp; Baby</a
-                        >
-                      </div>
-                      <div class="product-rating-price">
-                        <div class="wrapp-product-price">
-                          <span class="price"
-                            ><span class="woocommerce-Price-amount amount"
-                              ><bdi
-                                ><span class="woocommerce-Price-currencySymbol">&#36;</span
-                                >25.95</bdi
-                              ></span
-                            ></span
-                          >
-                        </div>
-                      </div>
-                      <div class="fade-in-block wd-scroll">
-                        <div class="hover-content wd-more-desc">
-                          <div class="hover-content-inner wd-more-desc-inner">
-                            It is like a shoulder &#8211; This car headrest made of high-quality
-                            leather and thickened memory foam, can effectively prevent
-                          </div>
-                          <a
-                            href="#"
-                            rel="nofollow"
-                            class="wd-more-desc-btn"
-                            aria-label="Read more description"
-                            ><span></span
-                          ></a>
-                        </div>
-                        <div class="wd-bottom-actions">
-                          <div class="wrap-wishlist-button">
-                            <div
-                              class="wd-wishlist-btn wd-action-btn wd-style-icon wd-wishlist-icon"
-                            >
-                              <a
-                                class=""
-                                href="https://khannawazllc.com/wishlist/"
-                                data-key="4dbc75bb3c"
-                                data-product-id="17423"
-                                rel="nofollow"
-                                data-added-text="Browse Wishlist"
-                              >
-                                <span>Add to wishlist</span>
-                              </a>
-                            </div>
-                          </div>
-                          <div class="wd-add-btn wd-add-btn-replace">
-                            <a
-                              href="?add-to-cart=17423"
-                              data-quantity="1"
-                              class="button product_type_simple add_to_cart_button ajax_add_to_cart add-to-cart-loop"
-                              data-product_id="17423"
-                              data-product_sku=""
-                              aria-label="Add to cart: &ldquo;ZORUNOWA Car Headrest Pillow Thickened Memory Foam Road Pal Headrest&rdquo;"
-                              rel="nofollow"
-                              data-success_message="&ldquo;ZORUNOWA Car Headrest Pillow Thickened Memory Foam Road Pal Headrest&rdquo; has been added to your cart"
-                              ><span>Add to cart</span></a
-                            >
-                          </div>
-                          <div class="wrap-quickview-button">
-                            <div class="quick-view wd-action-btn wd-style-icon wd-quick-view-icon">
-                              <a
-                                href="https://khannawazllc.com/product/zorunowa-car-headrest-pillow-thickened-memory-foam-road-pal-headrest/"
-                                class="open-quick-view quick-view-button"
-                                rel="nofollow"
-                                data-id="17423"
-                                >Quick view</a
-                              >
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-              </div>
-
-"""
-
-
-# --- Your HTML code as a string ---
-html_code_default = """
-    <div
-    class="row products products-loop products-grid et-isotope with-ajax row-count-4"
-    data-row-count="4"
-  >
-    <div class="et-loader product-ajax">
-      <svg class="loader-circular" viewBox="25 25 50 50" width="30" height="30">
-        <circle
-          class="loader-path"
-          cx="50"
-          cy="50"
-          r="20"
-          fill="none"
-          stroke-width="2"
-          stroke-miterlimit="10"
-        ></circle>
-      </svg>
-    </div>
-    <div class="ajax-content clearfix">
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3208 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3208"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3208"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/ad-diaper-rash-ointment-1-5oz-2-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31eM4JQL3L-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31eM4JQL3L-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31eM4JQL3L-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31eM4JQL3L-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31eM4JQL3L-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31eM4JQL3L-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31eM4JQL3L.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3208">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/ad-diaper-rash-ointment-1-5oz-2-pack/"
-                >A&D Diaper Rash Ointment 1.5oz, 2-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>10.94</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3208"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3208"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3208"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;A&amp;D Diaper Rash Ointment 1.5oz, 2-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="A&amp;D Diaper Rash Ointment 1.5oz, 2-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3208"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3208"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3208"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3339 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3339"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3339"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/babe-pediatric-cradle-cap-shampoo-200ml/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31uXpVU6uTL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31uXpVU6uTL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31uXpVU6uTL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31uXpVU6uTL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31uXpVU6uTL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31uXpVU6uTL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31uXpVU6uTL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3339">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/babe-pediatric-cradle-cap-shampoo-200ml/"
-                >Babe Pediatric Cradle Cap Shampoo, 200ml</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>13.90</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3339"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3339"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3339"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Babe Pediatric Cradle Cap Shampoo, 200ml&rdquo;"
-              rel="nofollow"
-              data-product_name="Babe Pediatric Cradle Cap Shampoo, 200ml"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3339"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3339"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3339"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3412 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3412"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3412"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/baby-vac-vacuum-baby-nasal-aspirator/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41wmzAsfCL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41wmzAsfCL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41wmzAsfCL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41wmzAsfCL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41wmzAsfCL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41wmzAsfCL-10x10.jpg    10w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3412">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/baby-vac-vacuum-baby-nasal-aspirator/"
-                >BABY-VAC Vacuum Baby Nasal Aspirator</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>11.69</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3412"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3412"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3412"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;BABY-VAC Vacuum Baby Nasal Aspirator&rdquo;"
-              rel="nofollow"
-              data-product_name="BABY-VAC Vacuum Baby Nasal Aspirator"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3412"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3412"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3412"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3218 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3218"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3218"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/bamboobies-reusable-nursing-pads-8-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/51O2fFSA3tL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/51O2fFSA3tL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51O2fFSA3tL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51O2fFSA3tL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51O2fFSA3tL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51O2fFSA3tL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51O2fFSA3tL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3218">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/bamboobies-reusable-nursing-pads-8-pack/"
-                >Bamboobies Reusable Nursing Pads, 8-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>16.99</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3218"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3218"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3218"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Bamboobies Reusable Nursing Pads, 8-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="Bamboobies Reusable Nursing Pads, 8-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3218"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3218"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3218"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3204 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3204"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3204"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/boogie-bottoms-diaper-rash-spray-3-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/51IP-gZ4sDL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/51IP-gZ4sDL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51IP-gZ4sDL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51IP-gZ4sDL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51IP-gZ4sDL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51IP-gZ4sDL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51IP-gZ4sDL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3204">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/boogie-bottoms-diaper-rash-spray-3-pack/"
-                >Boogie Bottoms Diaper Rash Spray, 3-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>28.47</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3204"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3204"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3204"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Boogie Bottoms Diaper Rash Spray, 3-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="Boogie Bottoms Diaper Rash Spray, 3-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3204"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3204"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3204"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3211 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3211"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3211"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/boogie-wipes-fresh-scent-180-count/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/5138MzYWbfL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/5138MzYWbfL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5138MzYWbfL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5138MzYWbfL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5138MzYWbfL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5138MzYWbfL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5138MzYWbfL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3211">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/boogie-wipes-fresh-scent-180-count/"
-                >Boogie Wipes Fresh Scent, 180 Count</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>23.94</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3211"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3211"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3211"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Boogie Wipes Fresh Scent, 180 Count&rdquo;"
-              rel="nofollow"
-              data-product_name="Boogie Wipes Fresh Scent, 180 Count"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3211"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3211"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3211"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3408 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3408"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3408"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/boogie-wipes-grape-scent-180-count-pack-of-6/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/51Io1E1W69L-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/51Io1E1W69L-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Io1E1W69L-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Io1E1W69L-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Io1E1W69L-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Io1E1W69L-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Io1E1W69L.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3408">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/boogie-wipes-grape-scent-180-count-pack-of-6/"
-                >Boogie Wipes Grape Scent, 180 Count (Pack of 6)</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>23.94</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3408"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3408"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3408"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Boogie Wipes Grape Scent, 180 Count (Pack of 6)&rdquo;"
-              rel="nofollow"
-              data-product_name="Boogie Wipes Grape Scent, 180 Count (Pack of 6)"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3408"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3408"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3408"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3413 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3413"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3413"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/boogie-wipes-unscented-baby-wipes-180-count/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/51DoeMjiKJL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/51DoeMjiKJL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51DoeMjiKJL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51DoeMjiKJL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51DoeMjiKJL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51DoeMjiKJL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51DoeMjiKJL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3413">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/boogie-wipes-unscented-baby-wipes-180-count/"
-                >Boogie Wipes Unscented Baby Wipes, 180 Count</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>23.82</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3413"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3413"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3413"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Boogie Wipes Unscented Baby Wipes, 180 Count&rdquo;"
-              rel="nofollow"
-              data-product_name="Boogie Wipes Unscented Baby Wipes, 180 Count"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3413"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3413"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3413"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3410 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3410"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3410"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/boudreauxs-max-strength-diaper-rash-cream-2oz-14oz/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41m4vpC9SeL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41m4vpC9SeL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41m4vpC9SeL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41m4vpC9SeL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41m4vpC9SeL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41m4vpC9SeL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41m4vpC9SeL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3410">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a
-                href="https://4strader.shop/product/boudreauxs-max-strength-diaper-rash-cream-2oz-14oz/"
-                >Boudreaux&#8217;s Max Strength Diaper Rash Cream, 2oz & 14oz</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>34.10</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3410"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3410"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3410"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Boudreaux&#039;s Max Strength Diaper Rash Cream, 2oz &amp; 14oz&rdquo;"
-              rel="nofollow"
-              data-product_name="Boudreaux&#039;s Max Strength Diaper Rash Cream, 2oz &amp; 14oz"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3410"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3410"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3410"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3407 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3407"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3407"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/childs-farm-unfragranced-moisturiser-250ml/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/51mDZi6w2L-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/51mDZi6w2L-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51mDZi6w2L-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51mDZi6w2L-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51mDZi6w2L-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51mDZi6w2L-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51mDZi6w2L.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3407">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/childs-farm-unfragranced-moisturiser-250ml/"
-                >Childs Farm Unfragranced Moisturiser, 250ml</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>9.99</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3407"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3407"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3407"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Childs Farm Unfragranced Moisturiser, 250ml&rdquo;"
-              rel="nofollow"
-              data-product_name="Childs Farm Unfragranced Moisturiser, 250ml"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3407"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3407"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3407"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3214 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3214"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3214"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/constructive-eating-construction-combo-set/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/51Ol2jgTPnL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/51Ol2jgTPnL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Ol2jgTPnL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Ol2jgTPnL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Ol2jgTPnL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Ol2jgTPnL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51Ol2jgTPnL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3214">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/constructive-eating-construction-combo-set/"
-                >Constructive Eating Construction Combo Set</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>35.95</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3214"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3214"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3214"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Constructive Eating Construction Combo Set&rdquo;"
-              rel="nofollow"
-              data-product_name="Constructive Eating Construction Combo Set"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3214"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3214"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3214"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3336 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3336"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3336"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/dr-browns-soft-spout-transition-cup-6oz-pink/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31v4k2Jc9TL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31v4k2Jc9TL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31v4k2Jc9TL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31v4k2Jc9TL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31v4k2Jc9TL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31v4k2Jc9TL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31v4k2Jc9TL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3336">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/dr-browns-soft-spout-transition-cup-6oz-pink/"
-                >Dr. Brown&#8217;s Soft-Spout Transition Cup, 6oz, Pink</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>16.99</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3336"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3336"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3336"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Dr. Brown&#039;s Soft-Spout Transition Cup, 6oz, Pink&rdquo;"
-              rel="nofollow"
-              data-product_name="Dr. Brown&#039;s Soft-Spout Transition Cup, 6oz, Pink"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3336"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3336"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3336"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3278 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3278"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3278"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/dr-browns-wide-neck-anti-colic-bottles-8oz-3pk/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31sRdrENMaL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31sRdrENMaL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31sRdrENMaL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31sRdrENMaL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31sRdrENMaL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31sRdrENMaL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31sRdrENMaL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3278">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a
-                href="https://4strader.shop/product/dr-browns-wide-neck-anti-colic-bottles-8oz-3pk/"
-                >Dr. Brown&#8217;s Wide-Neck Anti-Colic Bottles, 8oz, 3pk</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>32.88</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3278"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3278"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3278"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Dr. Brown&#039;s Wide-Neck Anti-Colic Bottles, 8oz, 3pk&rdquo;"
-              rel="nofollow"
-              data-product_name="Dr. Brown&#039;s Wide-Neck Anti-Colic Bottles, 8oz, 3pk"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3278"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3278"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3278"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3216 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3216"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3216"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/guess-how-much-i-love-you-activity-toy/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/316hj7-0VBL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/316hj7-0VBL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/316hj7-0VBL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/316hj7-0VBL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/316hj7-0VBL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/316hj7-0VBL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/316hj7-0VBL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3216">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/guess-how-much-i-love-you-activity-toy/"
-                >Guess How Much I Love You Activity Toy</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>12.99</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3216"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3216"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3216"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Guess How Much I Love You Activity Toy&rdquo;"
-              rel="nofollow"
-              data-product_name="Guess How Much I Love You Activity Toy"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3216"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3216"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3216"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3207 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3207"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3207"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/haakaa-silicone-manual-breast-pump/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41lnPwTnBKL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41lnPwTnBKL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41lnPwTnBKL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41lnPwTnBKL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41lnPwTnBKL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41lnPwTnBKL-10x10.jpg    10w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3207">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/haakaa-silicone-manual-breast-pump/"
-                >Haakaa Silicone Manual Breast Pump</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>12.94</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3207"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3207"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3207"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Haakaa Silicone Manual Breast Pump&rdquo;"
-              rel="nofollow"
-              data-product_name="Haakaa Silicone Manual Breast Pump"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3207"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3207"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3207"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3220 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3220"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3220"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/johnsons-baby-gel-oil-aloe-6-5oz-2-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/314wYipEL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/314wYipEL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/314wYipEL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/314wYipEL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/314wYipEL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/314wYipEL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/314wYipEL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3220">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/johnsons-baby-gel-oil-aloe-6-5oz-2-pack/"
-                >Johnson&#8217;s Baby Gel Oil Aloe 6.5oz, 2-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>15.00</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3220"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3220"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3220"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Johnson&#039;s Baby Gel Oil Aloe 6.5oz, 2-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="Johnson&#039;s Baby Gel Oil Aloe 6.5oz, 2-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3220"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3220"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3220"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3206 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3206"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3206"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/lavie-3-in-1-warming-lactation-massager/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/51RCKeLvmEL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/51RCKeLvmEL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51RCKeLvmEL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51RCKeLvmEL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51RCKeLvmEL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51RCKeLvmEL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51RCKeLvmEL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3206">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/lavie-3-in-1-warming-lactation-massager/"
-                >LaVie 3-in-1 Warming Lactation Massager</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>66.51</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3206"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3206"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3206"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;LaVie 3-in-1 Warming Lactation Massager&rdquo;"
-              rel="nofollow"
-              data-product_name="LaVie 3-in-1 Warming Lactation Massager"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3206"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3206"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3206"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3212 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3212"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3212"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/lucy-darling-little-artist-baby-memory-book/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41Qsy7SNmiL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41Qsy7SNmiL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41Qsy7SNmiL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41Qsy7SNmiL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41Qsy7SNmiL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41Qsy7SNmiL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41Qsy7SNmiL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3212">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/lucy-darling-little-artist-baby-memory-book/"
-                >Lucy Darling Little Artist Baby Memory Book</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>35.95</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3212"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3212"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3212"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Lucy Darling Little Artist Baby Memory Book&rdquo;"
-              rel="nofollow"
-              data-product_name="Lucy Darling Little Artist Baby Memory Book"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3212"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3212"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3212"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3409 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3409"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3409"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/mam-medium-flow-teats-size-2-2-months/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41vltKrSPXL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41vltKrSPXL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41vltKrSPXL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41vltKrSPXL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41vltKrSPXL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41vltKrSPXL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41vltKrSPXL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3409">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/mam-medium-flow-teats-size-2-2-months/"
-                >Mam Medium Flow Teats Size 2, 2+ Months</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>9.74</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3409"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3409"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3409"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Mam Medium Flow Teats Size 2, 2+ Months&rdquo;"
-              rel="nofollow"
-              data-product_name="Mam Medium Flow Teats Size 2, 2+ Months"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3409"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3409"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3409"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3222 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3222"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3222"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/metanium-nappy-rash-ointment-30g/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41gsTJoTnIL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41gsTJoTnIL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41gsTJoTnIL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41gsTJoTnIL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41gsTJoTnIL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41gsTJoTnIL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41gsTJoTnIL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3222">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/metanium-nappy-rash-ointment-30g/"
-                >Metanium Nappy Rash Ointment 30g</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>13.48</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3222"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3222"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3222"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Metanium Nappy Rash Ointment 30g&rdquo;"
-              rel="nofollow"
-              data-product_name="Metanium Nappy Rash Ointment 30g"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3222"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3222"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3222"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3337 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3337"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3337"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/pampers-cruisers-360-size-4-62-count/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41DBVJEqTML-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41DBVJEqTML-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41DBVJEqTML-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41DBVJEqTML-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41DBVJEqTML-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41DBVJEqTML-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41DBVJEqTML.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3337">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/pampers-cruisers-360-size-4-62-count/"
-                >Pampers Cruisers 360?, Size 4, 62 Count</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>37.99</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3337"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3337"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3337"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Pampers Cruisers 360?, Size 4, 62 Count&rdquo;"
-              rel="nofollow"
-              data-product_name="Pampers Cruisers 360?, Size 4, 62 Count"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3337"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3337"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3337"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3213 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3213"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3213"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/philips-avent-anti-colic-bottle-9oz-4-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31CUTmKwtJL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31CUTmKwtJL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31CUTmKwtJL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31CUTmKwtJL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31CUTmKwtJL-1x1.jpg       1w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3213">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/philips-avent-anti-colic-bottle-9oz-4-pack/"
-                >Philips Avent Anti-colic Bottle 9oz, 4-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>24.99</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3213"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3213"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3213"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Philips Avent Anti-colic Bottle 9oz, 4-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="Philips Avent Anti-colic Bottle 9oz, 4-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3213"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3213"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3213"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3225 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3225"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3225"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/philips-avent-anti-colic-fast-flow-nipple-4pk/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41vPvQ4Q5qL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41vPvQ4Q5qL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41vPvQ4Q5qL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41vPvQ4Q5qL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41vPvQ4Q5qL-1x1.jpg       1w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3225">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/philips-avent-anti-colic-fast-flow-nipple-4pk/"
-                >Philips Avent Anti-colic Fast Flow Nipple, 4pk</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>22.53</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3225"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3225"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3225"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Philips Avent Anti-colic Fast Flow Nipple, 4pk&rdquo;"
-              rel="nofollow"
-              data-product_name="Philips Avent Anti-colic Fast Flow Nipple, 4pk"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3225"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3225"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3225"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3219 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3219"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3219"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/philips-avent-baby-bottle-warmer/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31WJ6kTCkjL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31WJ6kTCkjL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31WJ6kTCkjL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31WJ6kTCkjL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31WJ6kTCkjL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31WJ6kTCkjL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31WJ6kTCkjL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3219">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/philips-avent-baby-bottle-warmer/"
-                >Philips Avent Baby Bottle Warmer</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>82.11</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3219"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3219"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3219"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Philips Avent Baby Bottle Warmer&rdquo;"
-              rel="nofollow"
-              data-product_name="Philips Avent Baby Bottle Warmer"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3219"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3219"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3219"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3338 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3338"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3338"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/philips-avent-bottle-brush-blue/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41tOQrkBM7L-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41tOQrkBM7L-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41tOQrkBM7L-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41tOQrkBM7L-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41tOQrkBM7L-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41tOQrkBM7L-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41tOQrkBM7L.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3338">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/philips-avent-bottle-brush-blue/"
-                >Philips Avent Bottle Brush, Blue</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>16.61</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3338"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3338"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3338"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Philips Avent Bottle Brush, Blue&rdquo;"
-              rel="nofollow"
-              data-product_name="Philips Avent Bottle Brush, Blue"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3338"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3338"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3338"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3406 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3406"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3406"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/philips-avent-classic-fast-flow-nipple-2-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41QF976WyrL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41QF976WyrL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41QF976WyrL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41QF976WyrL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41QF976WyrL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41QF976WyrL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41QF976WyrL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3406">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/philips-avent-classic-fast-flow-nipple-2-pack/"
-                >Philips AVENT Classic Fast Flow Nipple, 2-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>8.00</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3406"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3406"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3406"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Philips AVENT Classic Fast Flow Nipple, 2-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="Philips AVENT Classic Fast Flow Nipple, 2-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3406"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3406"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3406"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3221 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3221"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3221"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/philips-avent-fast-flow-nipple-2-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41YujZ3xv6L-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41YujZ3xv6L-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41YujZ3xv6L-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41YujZ3xv6L-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41YujZ3xv6L-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41YujZ3xv6L-10x10.jpg    10w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3221">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/philips-avent-fast-flow-nipple-2-pack/"
-                >Philips Avent Fast Flow Nipple, 2-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>14.00</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3221"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3221"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3221"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Philips Avent Fast Flow Nipple, 2-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="Philips Avent Fast Flow Nipple, 2-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3221"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3221"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3221"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3215 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3215"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3215"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/philips-avent-slow-flow-nipple-4-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41-NkL5QmuL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41-NkL5QmuL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41-NkL5QmuL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41-NkL5QmuL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41-NkL5QmuL-1x1.jpg       1w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3215">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/philips-avent-slow-flow-nipple-4-pack/"
-                >Philips Avent Slow Flow Nipple, 4-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>24.78</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3215"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3215"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3215"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Philips Avent Slow Flow Nipple, 4-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="Philips Avent Slow Flow Nipple, 4-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3215"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3215"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3215"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3217 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3217"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3217"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/playtex-baby-nurser-bottle-gift-set/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41u2mJcZQJL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41u2mJcZQJL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41u2mJcZQJL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41u2mJcZQJL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41u2mJcZQJL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41u2mJcZQJL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41u2mJcZQJL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3217">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/playtex-baby-nurser-bottle-gift-set/"
-                >Playtex Baby Nurser Bottle Gift Set</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>69.65</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3217"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3217"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3217"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Playtex Baby Nurser Bottle Gift Set&rdquo;"
-              rel="nofollow"
-              data-product_name="Playtex Baby Nurser Bottle Gift Set"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3217"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3217"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3217"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3224 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3224"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3224"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/pull-ups-boys-potty-training-pants-25-ct/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31STmjBH9dL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31STmjBH9dL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31STmjBH9dL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31STmjBH9dL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31STmjBH9dL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31STmjBH9dL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31STmjBH9dL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3224">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/pull-ups-boys-potty-training-pants-25-ct/"
-                >Pull-Ups Boys&#8217; Potty Training Pants, 25 Ct</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>22.70</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3224"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3224"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3224"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Pull-Ups Boys&#039; Potty Training Pants, 25 Ct&rdquo;"
-              rel="nofollow"
-              data-product_name="Pull-Ups Boys&#039; Potty Training Pants, 25 Ct"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3224"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3224"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3224"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3279 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3279"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3279"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/safe-baby-tech-crystal-clear-car-mirror/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/5130nYGuvLL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/5130nYGuvLL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5130nYGuvLL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5130nYGuvLL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5130nYGuvLL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5130nYGuvLL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/5130nYGuvLL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3279">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/safe-baby-tech-crystal-clear-car-mirror/"
-                >Safe Baby Tech Crystal Clear Car Mirror</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>14.82</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3279"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3279"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3279"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Safe Baby Tech Crystal Clear Car Mirror&rdquo;"
-              rel="nofollow"
-              data-product_name="Safe Baby Tech Crystal Clear Car Mirror"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3279"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3279"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3279"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3209 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3209"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3209"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/safety-1st-sleepy-baby-nail-clipper/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31XXWjWFdwL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31XXWjWFdwL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31XXWjWFdwL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31XXWjWFdwL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31XXWjWFdwL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31XXWjWFdwL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31XXWjWFdwL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3209">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/safety-1st-sleepy-baby-nail-clipper/"
-                >Safety 1st Sleepy Baby Nail Clipper</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>7.00</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3209"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3209"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3209"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Safety 1st Sleepy Baby Nail Clipper&rdquo;"
-              rel="nofollow"
-              data-product_name="Safety 1st Sleepy Baby Nail Clipper"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3209"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3209"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3209"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3277 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3277"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3277"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/seventh-gen-baby-wipes-refill-6pk-384-count/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41ch94zvAXL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41ch94zvAXL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41ch94zvAXL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41ch94zvAXL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41ch94zvAXL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41ch94zvAXL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41ch94zvAXL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3277">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/seventh-gen-baby-wipes-refill-6pk-384-count/"
-                >Seventh Gen. Baby Wipes Refill, 6pk (384 Count)</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>19.74</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3277"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3277"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3277"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Seventh Gen. Baby Wipes Refill, 6pk (384 Count)&rdquo;"
-              rel="nofollow"
-              data-product_name="Seventh Gen. Baby Wipes Refill, 6pk (384 Count)"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3277"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3277"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3277"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3210 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3210"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3210"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/spectra-breast-milk-pump-kit-24mm/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/51ytlG1PJS-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/51ytlG1PJS-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51ytlG1PJS-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51ytlG1PJS-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51ytlG1PJS-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51ytlG1PJS-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/51ytlG1PJS.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3210">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/spectra-breast-milk-pump-kit-24mm/"
-                >Spectra Breast Milk Pump Kit, 24mm</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>28.91</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3210"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3210"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3210"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Spectra Breast Milk Pump Kit, 24mm&rdquo;"
-              rel="nofollow"
-              data-product_name="Spectra Breast Milk Pump Kit, 24mm"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3210"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3210"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3210"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3205 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3205"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3205"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/spectra-wide-neck-baby-bottles-2-pack/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41RvidROD7L-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41RvidROD7L-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41RvidROD7L-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41RvidROD7L-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41RvidROD7L-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41RvidROD7L-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41RvidROD7L.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3205">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/spectra-wide-neck-baby-bottles-2-pack/"
-                >Spectra Wide Neck Baby Bottles, 2-Pack</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>14.49</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3205"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3205"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3205"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Spectra Wide Neck Baby Bottles, 2-Pack&rdquo;"
-              rel="nofollow"
-              data-product_name="Spectra Wide Neck Baby Bottles, 2-Pack"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3205"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3205"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3205"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-
-      <div
-        class="wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3411 status-publish last instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3411"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3411"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/sterimar-baby-nasal-hygiene-spray/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/31P3Rr9aGfL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/31P3Rr9aGfL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31P3Rr9aGfL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31P3Rr9aGfL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31P3Rr9aGfL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31P3Rr9aGfL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/31P3Rr9aGfL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3411">Quick View</span>
-            </footer>
-          </div>
-
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/sterimar-baby-nasal-hygiene-spray/"
-                >Sterimar Baby Nasal Hygiene Spray</a
-              >
-            </h2>
-
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>13.24</bdi></span
-              ></span
-            >
-
-            <a
-              href="?add-to-cart=3411"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3411"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3411"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Sterimar Baby Nasal Hygiene Spray&rdquo;"
-              rel="nofollow"
-              data-product_name="Sterimar Baby Nasal Hygiene Spray"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3411"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3411"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3411"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
+def load_fixture(name):
+    """
+    Reads one of the sample HTML pages from FIXTURES_DIR as raw UTF-8 bytes.
+    """
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
 
-      <div
-        class="first grid-sizer wishlist-disabled col-md-3 col-sm-6 col-xs-6 et-isotope-item product-hover-disable product-view-default view-color-white et_cart-on hide-hover-on-mobile product type-product post-3223 status-publish instock product_cat-baby-products has-post-thumbnail shipping-taxable purchasable product-type-simple"
-      >
-        <div class="content-product">
-          <div class="product-image-wrapper hover-effect-disable">
-            <a
-              href="https://4strader.shop/my-account/?et-wishlist-page&#038;add_to_wishlist=3223"
-              class="xstore-wishlist xstore-wishlist-icon xstore-wishlist-has-animation"
-              data-action="add"
-              data-id="3223"
-              data-settings='{"iconAdd":"et-heart","iconRemove":"et-heart-o","addText":"Add to Wishlist","removeText":"Remove from Wishlist"}'
-            >
-              <span class="et-icon et-heart"></span>
-            </a>
-            <p class="stock in-stock step-1">50 in stock</p>
-            <a
-              class="product-content-image"
-              href="https://4strader.shop/product/vaseline-baby-petroleum-jelly-13oz-pack-of-2/"
-              data-images=""
-            >
-              <img
-                width="300"
-                height="300"
-                src="https://4strader.shop/wp-content/uploads/2023/07/41MudyxBL-300x300.jpg"
-                class="attachment-woocommerce_thumbnail size-woocommerce_thumbnail"
-                alt=""
-                decoding="async"
-                srcset="
-                  https://4strader.shop/wp-content/uploads/2023/07/41MudyxBL-300x300.jpg 300w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41MudyxBL-150x150.jpg 150w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41MudyxBL-100x100.jpg 100w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41MudyxBL-1x1.jpg       1w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41MudyxBL-10x10.jpg    10w,
-                  https://4strader.shop/wp-content/uploads/2023/07/41MudyxBL.jpg         500w
-                "
-                sizes="(max-width: 300px) 100vw, 300px"
-              />
-            </a>
-            <footer class="footer-product">
-              <span class="show-quickly" data-prodid="3223">Quick View</span>
-            </footer>
-          </div>
 
-          <div class="text-center product-details">
-            <div class="products-page-cats">
-              <a href="https://4strader.shop/product-category/baby-products/" rel="tag"
-                >Baby Products</a
-              >
-            </div>
-            <h2 class="product-title">
-              <a href="https://4strader.shop/product/vaseline-baby-petroleum-jelly-13oz-pack-of-2/"
-                >Vaseline Baby Petroleum Jelly, 13oz (Pack of 2)</a
-              >
-            </h2>
+# --- Run the extraction ---
+def main():
+    """
+    Runs the extraction for both sample site structures.
+    Kept in a function rather than at module scope so JITs like PyPy trace it normally.
+    """
+    html_code_default = load_fixture("default.html") # 4strader.shop structure
+    html_code_woodmart = load_fixture("woodmart.html") # khannawazllc.com structure (WoodMart theme)
 
-            <span class="price"
-              ><span class="woocommerce-Price-amount amount"
-                ><bdi><span class="woocommerce-Price-currencySymbol">&#36;</span>16.33</bdi></span
-              ></span
-            >
+    print("--- Running for 'default' site type (4strader.shop like) ---")
+    extract_product_info(html_code_default, site_type="default", encoding="utf-8")
+    print("\n\n--- Running for 'woodmart' site type (khannawazllc.com like) ---")
+    extract_product_info(html_code_woodmart, site_type="woodmart", encoding="utf-8")
 
-            <a
-              href="?add-to-cart=3223"
-              aria-describedby="woocommerce_loop_add_to_cart_link_describedby_3223"
-              data-quantity="1"
-              class="button product_type_simple add_to_cart_button ajax_add_to_cart"
-              data-product_id="3223"
-              data-product_sku=""
-              aria-label="Add to cart: &ldquo;Vaseline Baby Petroleum Jelly, 13oz (Pack of 2)&rdquo;"
-              rel="nofollow"
-              data-product_name="Vaseline Baby Petroleum Jelly, 13oz (Pack of 2)"
-              >Add to cart</a
-            ><span
-              id="woocommerce_loop_add_to_cart_link_describedby_3223"
-              class="screen-reader-text"
-            >
-            </span>
-            <a
-              href="https://4strader.shop/my-account/?et-compare-page&#038;add_to_compare=3223"
-              class="xstore-compare"
-              data-action="add"
-              data-id="3223"
-              data-settings='{"iconAdd":"et-compare","iconRemove":"et-compare","addText":"Add to Compare","removeText":"Remove"}'
-            >
-              <span class="et-icon et-compare"></span>
-              <span class="button-text et-element-label">Add to Compare</span>
-            </a>
-          </div>
-        </div>
-        <!-- .content-product -->
-      </div>
-    </div>
-  </div>
-"""
 
-# --- Run the extraction ---
 if __name__ == "__main__":
-    print("--- Running for 'default' site type (4strader.shop like) ---")
-    extract_product_info(html_code_default, site_type="default")
-    print("\n\n--- Running for 'woodmart' site type (khannawazllc.com like) ---")
-    extract_product_info(html_code_woodmart, site_type="woodmart")
\ No newline at end of file
+    main()